@@ -1,11 +1,14 @@
+import types
 import typing
 
 from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import _generative
 from sqlalchemy.sql.compiler import COLLECT_CARTESIAN_PRODUCTS
 from sqlalchemy.sql.compiler import WARN_LINTING
 from sqlalchemy.sql.compiler import FromLinter
 from sqlalchemy.sql.compiler import SQLCompiler
 from sqlalchemy.sql.expression import Select as _Select
+from sqlalchemy.sql.visitors import InternalTraversal
 
 from ._window import Window
 
@@ -18,11 +21,18 @@ class Select(_Select):
 
     inherit_cache: bool = True
 
+    _traverse_internals = _Select._traverse_internals + [
+        ("_window_clause", InternalTraversal.dp_clauseelement_tuple),
+    ]
+    _cache_key_traversal = _traverse_internals + [
+        ("_compile_options", InternalTraversal.dp_has_cache_key),
+    ]
+
     _window_clause: typing.Tuple[Window, ...] = ()
 
+    @_generative
     def window(self, *windows: Window) -> "Select":
         """Return a new `Select` object with extended WINDOW clause."""
-        assert isinstance(self._window_clause, tuple)
         self._window_clause += windows
         return self
 
@@ -49,45 +59,82 @@ def select(*entities: "_ColumnsClauseArgument[typing.Any]") -> Select:
     return Select(*entities)
 
 
-@compiles(Select, "postgresql")
-def compile_select(element: Select, compiler: SQLCompiler, **kwargs: typing.Any) -> str:
-    # This function is copied directly from SQLCompiler
-    def _compose_select_body(
-        text: str,
-        select: Select,
+def _compose_select_body(
+    compiler: SQLCompiler,
+    text: str,
+    select: _Select,
+    compile_state,
+    inner_columns,
+    froms,
+    byfrom,
+    toplevel,
+    kwargs: typing.Dict[str, typing.Any],
+) -> str:
+    # The SELECT being composed is always on top of the compiler's stack,
+    # nested subqueries are compiled later on and sit deeper than that.
+    window_clause = compiler._window_clauses.get(len(compiler.stack))  # type: ignore[attr-defined]
+    if not window_clause:
+        return type(compiler)._compose_select_body(
+            compiler, text, select, compile_state, inner_columns, froms, byfrom, toplevel, kwargs
+        )
+
+    return _compose_select_body_with_window(
+        compiler,
+        text,
+        select,
         compile_state,
         inner_columns,
         froms,
         byfrom,
         toplevel,
-        kwargs: typing.Dict[str, typing.Any],
-    ) -> str:  # pragma: no cover
-        text += ", ".join(inner_columns)
-
-        if compiler.linting & COLLECT_CARTESIAN_PRODUCTS:
-            from_linter = FromLinter({}, set())
-            warn_linting = compiler.linting & WARN_LINTING
-            if toplevel:
-                compiler.from_linter = from_linter
-        else:
-            from_linter = None
-            warn_linting = False
-
-        # adjust the whitespace for no inner columns, part of #9440,
-        # so that a no-col SELECT comes out as "SELECT WHERE..." or
-        # "SELECT FROM ...".
-        # while it would be better to have built the SELECT starting string
-        # without trailing whitespace first, then add whitespace only if inner
-        # cols were present, this breaks compatibility with various custom
-        # compilation schemes that are currently being tested.
-        if not inner_columns:
-            text = text.rstrip()
-
-        if froms:
-            text += " \nFROM "
-
-            if select._hints:
-                text += ", ".join(
+        kwargs,
+        window_clause,
+    )
+
+
+def _compose_select_body_with_window(
+    compiler: SQLCompiler,
+    text: str,
+    select: _Select,
+    compile_state,
+    inner_columns,
+    froms,
+    byfrom,
+    toplevel,
+    kwargs: typing.Dict[str, typing.Any],
+    window_clause: typing.Tuple[Window, ...],
+) -> str:  # pragma: no cover
+    # This function is copied directly from SQLCompiler, except that
+    # the text is collected into a list and joined once at the end.
+    text += ", ".join(inner_columns)
+
+    if compiler.linting & COLLECT_CARTESIAN_PRODUCTS:
+        from_linter = FromLinter({}, set())
+        warn_linting = compiler.linting & WARN_LINTING
+        if toplevel:
+            compiler.from_linter = from_linter
+    else:
+        from_linter = None
+        warn_linting = False
+
+    # adjust the whitespace for no inner columns, part of #9440,
+    # so that a no-col SELECT comes out as "SELECT WHERE..." or
+    # "SELECT FROM ...".
+    # while it would be better to have built the SELECT starting string
+    # without trailing whitespace first, then add whitespace only if inner
+    # cols were present, this breaks compatibility with various custom
+    # compilation schemes that are currently being tested.
+    if not inner_columns:
+        text = text.rstrip()
+
+    parts = [text]
+
+    if froms:
+        parts.append(" \nFROM ")
+
+        if select._hints:
+            parts.append(
+                ", ".join(
                     [
                         f._compiler_dispatch(
                             compiler,
@@ -99,8 +146,10 @@ def compile_select(element: Select, compiler: SQLCompiler, **kwargs: typing.Any)
                         for f in froms
                     ]
                 )
-            else:
-                text += ", ".join(
+            )
+        else:
+            parts.append(
+                ", ".join(
                     [
                         f._compiler_dispatch(
                             compiler,
@@ -111,54 +160,65 @@ def compile_select(element: Select, compiler: SQLCompiler, **kwargs: typing.Any)
                         for f in froms
                     ]
                 )
-        else:
-            text += compiler.default_from()
-
-        if select._where_criteria:
-            t = compiler._generate_delimited_and_list(
-                select._where_criteria, from_linter=from_linter, **kwargs
             )
-            if t:
-                text += " \nWHERE " + t
+    else:
+        parts.append(compiler.default_from())
 
-        if warn_linting:
-            assert from_linter is not None
-            from_linter.warn()
+    if select._where_criteria:
+        t = compiler._generate_delimited_and_list(
+            select._where_criteria, from_linter=from_linter, **kwargs
+        )
+        if t:
+            parts.append(" \nWHERE " + t)
 
-        if select._group_by_clauses:
-            text += compiler.group_by_clause(select, **kwargs)
+    if warn_linting:
+        assert from_linter is not None
+        from_linter.warn()
 
-        if select._having_criteria:
-            t = compiler._generate_delimited_and_list(select._having_criteria, **kwargs)
-            if t:
-                text += " \nHAVING " + t
+    if select._group_by_clauses:
+        parts.append(compiler.group_by_clause(select, **kwargs))
 
-        # Here's the logic for rendering a WINDOW clause.
-        # 'select' is a freshly composed base Select object
-        # so we use 'element' to get the original window clause.
-        if hasattr(element, "_window_clause") and element._window_clause:
-            t = ", ".join(compiler.process(window, **kwargs) for window in element._window_clause)
-            if t:
-                text += " \nWINDOW " + t
+    if select._having_criteria:
+        t = compiler._generate_delimited_and_list(select._having_criteria, **kwargs)
+        if t:
+            parts.append(" \nHAVING " + t)
 
-        if select._order_by_clauses:
-            text += compiler.order_by_clause(select, **kwargs)
+    # Here's the logic for rendering a WINDOW clause.
+    # 'select' is a freshly composed base Select object
+    # so we use the window clause registered by 'compile_select'.
+    if window_clause:
+        parts.append(" \nWINDOW ")
+        parts.append(", ".join([compiler.process(window, **kwargs) for window in window_clause]))
 
-        if select._has_row_limiting_clause:
-            text += compiler._row_limit_clause(select, **kwargs)
+    if select._order_by_clauses:
+        parts.append(compiler.order_by_clause(select, **kwargs))
 
-        if select._for_update_arg is not None:
-            text += compiler.for_update_clause(select, **kwargs)
+    if select._has_row_limiting_clause:
+        parts.append(compiler._row_limit_clause(select, **kwargs))
 
-        return text
+    if select._for_update_arg is not None:
+        parts.append(compiler.for_update_clause(select, **kwargs))
 
-    # Save original method
-    og_compose_select_body = compiler._compose_select_body
+    return "".join(parts)
 
-    # Monkey patch the method
-    compiler._compose_select_body = _compose_select_body  # type: ignore[method-assign]
-    text = compiler.visit_select(element, **kwargs)
 
-    # Restore original version
-    compiler._compose_select_body = og_compose_select_body  # type: ignore[method-assign]
-    return text
+@compiles(Select, "postgresql")
+def compile_select(element: Select, compiler: SQLCompiler, **kwargs: typing.Any) -> str:
+    if not element._window_clause:
+        return compiler.visit_select(element, **kwargs)
+
+    # Patch the compiler only once, the window clause itself is looked up
+    # by the stack depth of the SELECT it belongs to.
+    windows: typing.Dict[int, typing.Tuple[Window, ...]]
+    windows = compiler.__dict__.setdefault("_window_clauses", {})
+    if "_compose_select_body" not in compiler.__dict__:
+        compiler._compose_select_body = types.MethodType(  # type: ignore[method-assign]
+            _compose_select_body, compiler
+        )
+
+    depth = len(compiler.stack) + 1
+    windows[depth] = element._window_clause
+    try:
+        return compiler.visit_select(element, **kwargs)
+    finally:
+        del windows[depth]
@@ -13,6 +13,7 @@ from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.elements import _OverRange
 from sqlalchemy.sql.functions import FunctionElement
 from sqlalchemy.sql.roles import ByOfRole
+from sqlalchemy.sql.visitors import InternalTraversal
 
 if typing.TYPE_CHECKING:  # pragma: no cover
     from sqlalchemy.sql._typing import _ColumnExpressionArgument
@@ -31,6 +32,15 @@ _RangeType = typing.Union[_OverRange, int]
 
 _FT = typing.TypeVar("_FT")
 
+_LOWER_FIXED: typing.Dict[typing.Any, str] = {
+    RANGE_UNBOUNDED: "UNBOUNDED PRECEDING",
+    RANGE_CURRENT: "CURRENT ROW",
+}
+_UPPER_FIXED: typing.Dict[typing.Any, str] = {
+    RANGE_UNBOUNDED: "UNBOUNDED FOLLOWING",
+    RANGE_CURRENT: "CURRENT ROW",
+}
+
 
 class FrameExclude(enum.Enum):
     CURRENT_ROW = "CURRENT ROW"
@@ -54,6 +64,11 @@ class OverWindow(ColumnElement[_FT]):
 
     inherit_cache: bool = True
 
+    _traverse_internals = [
+        ("element", InternalTraversal.dp_clauseelement),
+        ("window", InternalTraversal.dp_clauseelement),
+    ]
+
     def __init__(self, element: FunctionElement[_FT], window: "Window") -> None:
         self.element = element
         self.window = window
@@ -99,12 +114,23 @@ class Window(ClauseElement):
 
     inherit_cache: bool = True
 
+    _traverse_internals = [
+        ("name", InternalTraversal.dp_string),
+        ("existing_window", InternalTraversal.dp_clauseelement),
+        ("partition_by", InternalTraversal.dp_clauseelement),
+        ("order_by", InternalTraversal.dp_clauseelement),
+        ("range_", InternalTraversal.dp_plain_obj),
+        ("rows", InternalTraversal.dp_plain_obj),
+        ("groups", InternalTraversal.dp_plain_obj),
+        ("exclude", InternalTraversal.dp_plain_obj),
+    ]
+
     partition_by: typing.Optional[ClauseList] = None
     order_by: typing.Optional[ClauseList] = None
 
-    range_: typing.Optional[_RangeType] = None
-    rows: typing.Optional[_RangeType] = None
-    groups: typing.Optional[_RangeType] = None
+    range_: typing.Optional[typing.Tuple[_RangeType, _RangeType]] = None
+    rows: typing.Optional[typing.Tuple[_RangeType, _RangeType]] = None
+    groups: typing.Optional[typing.Tuple[_RangeType, _RangeType]] = None
 
     def __init__(
         self,
@@ -142,7 +168,7 @@ class Window(ClauseElement):
                 _literal_as_text_role=ByOfRole,
             )
 
-        if sum(o is not None for o in (range_, rows, groups)) > 1:
+        if (range_ is not None) + (rows is not None) + (groups is not None) > 1:
             raise ArgumentError("'range_', 'rows' and 'groups' are mutually exclusive")
 
         for attr, value in (("range_", range_), ("rows", rows), ("groups", groups)):
@@ -162,19 +188,54 @@ class Window(ClauseElement):
         if not isinstance(range_, tuple) or len(range_) != 2:
             raise ArgumentError("2-tuple expected for range/rows/groups")
 
-        def normalize_boundary(b: typing.Any) -> _RangeType:
-            if b is None:
-                return RANGE_UNBOUNDED
+        return _normalize_boundary(range_[0]), _normalize_boundary(range_[1])
 
-            try:
-                b = int(b)
-            except ValueError as e:
-                raise ArgumentError("int or None expected for range value") from e
-            else:
-                return RANGE_CURRENT if b == 0 else b
-
-        lower, upper = map(normalize_boundary, range_)
-        return lower, upper
+    @util.memoized_property
+    def _frame_text(self) -> typing.Optional[str]:
+        # Frame clause doesn't depend on the dialect, so it is only built once.
+        frame: typing.Optional[str] = None
+        for word, value in (("RANGE", self.range_), ("ROWS", self.rows), ("GROUPS", self.groups)):
+            if value is not None:
+                frame = f"{word} BETWEEN {_format_frame_clause(value)}"
+
+        if frame and self.exclude:
+            frame += f" EXCLUDE {self.exclude.value}"
+
+        return frame
+
+    @util.memoized_property
+    def _body_template(self) -> str:
+        # Everything but the partition_by/order_by clauses and names is
+        # known upfront, those are filled in by `compile_window`.
+        partition_by, order_by, frame = self.partition_by, self.order_by, self._frame_text
+        parts = []
+        if partition_by is not None and len(partition_by) > 0:
+            parts.append("PARTITION BY {partition_by}")
+        if order_by is not None and len(order_by) > 0:
+            parts.append("ORDER BY {order_by}")
+        if frame:
+            parts.append(frame)
+
+        text = " ".join(parts)
+
+        if self.existing_window is not None:
+            text = f"{{existing_window}} {text}"
+
+        return f"{{name}} AS ({text})"
+
+    @util.memoized_property
+    def _static_text(self) -> typing.Optional[str]:
+        # Without PARTITION BY/ORDER BY clauses there is nothing left
+        # for the compiler to process, so the whole text is rendered upfront.
+        if any(
+            clause is not None and len(clause) > 0 for clause in (self.partition_by, self.order_by)
+        ):
+            return None
+
+        return self._body_template.format(
+            name=self.name,
+            existing_window=self.existing_window.name if self.existing_window is not None else "",
+        )
 
     def over_self(self, element: FunctionElement[_FT]) -> OverWindow[_FT]:
         """Construct an `OverWindow` object from a given function and self."""
@@ -245,55 +306,63 @@ def window(
     )
 
 
+def _normalize_boundary(b: typing.Any) -> _RangeType:
+    if b is None:
+        return RANGE_UNBOUNDED
+
+    # Plain ints are by far the most common, skip the conversion for them
+    if not isinstance(b, int) or isinstance(b, bool):
+        try:
+            b = int(b)
+        except ValueError as e:
+            raise ArgumentError("int or None expected for range value") from e
+
+    return RANGE_CURRENT if b == 0 else b
+
+
+def _format_frame_clause(range_: typing.Tuple[typing.Any, typing.Any]) -> str:
+    lower, upper = range_
+    lower_text = _LOWER_FIXED.get(lower) or (
+        f"{-lower} PRECEDING" if lower < 0 else f"{lower} FOLLOWING"
+    )
+    upper_text = _UPPER_FIXED.get(upper) or (
+        f"{-upper} PRECEDING" if upper < 0 else f"{upper} FOLLOWING"
+    )
+    return f"{lower_text} AND {upper_text}"
+
+
 @compiles(OverWindow)
 def compile_over_window(element: OverWindow, compiler: SQLCompiler, **kwargs: typing.Any) -> str:
-    return "{} OVER {}".format(compiler.process(element.element), element.window.name)
+    return f"{compiler.process(element.element, **kwargs)} OVER {element.window.name}"
 
 
 @compiles(Window, "postgresql")
 def compile_window(element: Window, compiler: SQLCompiler, **kwargs: typing.Any) -> str:
-    def format_frame_clause(
-        range_: typing.Tuple[typing.Union[typing.Any, int], typing.Union[typing.Any, int]]
-    ) -> str:
-        return "{} AND {}".format(
-            "UNBOUNDED PRECEDING"
-            if range_[0] is RANGE_UNBOUNDED
-            else "CURRENT ROW"
-            if range_[0] is RANGE_CURRENT
-            else "{} PRECEDING".format(abs(range_[0]))
-            if range_[0] < 0
-            else "{} FOLLOWING".format(abs(range_[0])),
-            "UNBOUNDED FOLLOWING"
-            if range_[1] is RANGE_UNBOUNDED
-            else "CURRENT ROW"
-            if range_[1] is RANGE_CURRENT
-            else "{} PRECEDING".format(abs(range_[1]))
-            if range_[1] < 0
-            else "{} FOLLOWING".format(abs(range_[1])),
-        )
-
-    frame: typing.Optional[str] = None
-    for word, attr in (("RANGE", "range_"), ("ROWS", "rows"), ("GROUPS", "groups")):
-        value = getattr(element, attr, None)
-        if value is not None:
-            frame = "{} BETWEEN {}".format(word, format_frame_clause(value))
-
-    if frame and element.exclude:
-        frame += " EXCLUDE {}".format(element.exclude.value)
-
-    text = " ".join(
-        [
-            "{} BY {}".format(word, compiler.process(clause))
-            for word, clause in (
-                ("PARTITION", element.partition_by),
-                ("ORDER", element.order_by),
-            )
-            if clause is not None and len(clause) > 0
-        ]
-        + ([frame] if frame else [])
+    static_text = element._static_text
+    if static_text is not None:
+        return static_text
+
+    # The same window may be rendered more than once during a single
+    # compilation pass, e.g. by every SELECT of a compound statement.
+    # Rendered text is kept on the compiler so it doesn't outlive the pass.
+    # Bound parameters render the same each time, only literal binds differ.
+    cache: typing.Dict[typing.Tuple[int, bool], str]
+    cache = compiler.__dict__.setdefault("_window_cache", {})
+    key = (id(element), bool(kwargs.get("literal_binds")))
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+
+    partition_by, order_by = element.partition_by, element.order_by
+    text = cache[key] = element._body_template.format(
+        name=element.name,
+        existing_window=(
+            element.existing_window.name if element.existing_window is not None else ""
+        ),
+        partition_by=(
+            compiler.process(partition_by, **kwargs) if partition_by is not None else ""
+        ),
+        order_by=compiler.process(order_by, **kwargs) if order_by is not None else "",
     )
-
-    if element.existing_window is not None:
-        text = "{} {}".format(element.existing_window.name, text)
-
-    return "{} AS ({})".format(element.name, text)
+    return text
@@ -35,3 +35,13 @@ def test_select_window_over_self():
     w = window("w")
     s = select(w.over_self(func.first_value(literal_column("foo"))).label("bar"))
     assert str(s.compile(dialect=postgresql.dialect())) == "SELECT first_value(foo) OVER w AS bar"
+
+
+def test_over_window_cache_key():
+    def cache_key(f, w):
+        return over_window(f(literal_column("foo")), w)._generate_cache_key()
+
+    w = window("w")
+    assert cache_key(func.min, w) == cache_key(func.min, w)
+    assert cache_key(func.min, w) != cache_key(func.max, w)
+    assert cache_key(func.min, w) != cache_key(func.min, window("v"))
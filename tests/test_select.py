@@ -1,7 +1,9 @@
 from sqlalchemy import func
+from sqlalchemy import union
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.sql import literal
 from sqlalchemy.sql import literal_column
+from sqlalchemy.sql import select as sql_select
 
 from sqlalchemy_window import over_window
 from sqlalchemy_window import select
@@ -61,3 +63,72 @@ def test_select_inherit_window():
         "SELECT 'foo' AS bar \n"
         "WINDOW inner_w AS (PARTITION BY col1), w AS (inner_w ORDER BY col2)"
     )
+
+
+def test_compound_select_with_shared_window():
+    w = window("w", partition_by=literal_column("asset"), order_by=literal_column("tim"))
+    s = union(
+        select(over_window(func.min(literal_column("price")), w).label("p")).window(w),
+        select(over_window(func.max(literal_column("price")), w).label("p")).window(w),
+    )
+    assert str(
+        s.compile(dialect=postgresql.dialect(), compile_kwargs=dict(literal_binds=True))
+    ) == (
+        "SELECT min(price) OVER w AS p \n"
+        "WINDOW w AS (PARTITION BY asset ORDER BY tim) "
+        "UNION "
+        "SELECT max(price) OVER w AS p \n"
+        "WINDOW w AS (PARTITION BY asset ORDER BY tim)"
+    )
+
+
+def test_select_window_not_rendered_in_subquery():
+    w = window("w", partition_by=literal_column("asset"))
+    subquery = sql_select(literal_column("asset"), literal_column("price")).subquery("prices")
+    s = select(
+        subquery.c.asset,
+        over_window(func.max(subquery.c.price), w).label("high"),
+    ).window(w)
+    assert str(
+        s.compile(dialect=postgresql.dialect(), compile_kwargs=dict(literal_binds=True))
+    ) == (
+        "SELECT prices.asset, max(prices.price) OVER w AS high \n"
+        "FROM (SELECT asset, price) AS prices \n"
+        "WINDOW w AS (PARTITION BY asset)"
+    )
+
+
+def test_select_cache_key_includes_window_clause():
+    def build(w):
+        return select(over_window(func.sum(literal_column("price")), w).label("total")).window(w)
+
+    w = window("w", partition_by=literal_column("asset"), rows=(None, 0))
+    same = window("w", partition_by=literal_column("asset"), rows=(None, 0))
+    other = window("w", partition_by=literal_column("asset"), rows=(None, 1))
+
+    assert build(w)._generate_cache_key() == build(same)._generate_cache_key()
+    assert build(w)._generate_cache_key() != build(other)._generate_cache_key()
+
+
+def test_select_window_with_literal_binds():
+    w = window("w", partition_by=literal("foo"), order_by=literal_column("bar"))
+    s = select(over_window(func.lag(literal_column("baz"), literal(1)), w).label("prev")).window(w)
+    assert str(
+        s.compile(dialect=postgresql.dialect(), compile_kwargs=dict(literal_binds=True))
+    ) == ("SELECT lag(baz, 1) OVER w AS prev \n" "WINDOW w AS (PARTITION BY 'foo' ORDER BY bar)")
+
+
+def test_select_window_is_generative():
+    s = select(literal_column("foo"))
+    w = window("w")
+    assert s.window(w) is not s
+    assert s.window(w)._window_clause == (w,)
+    assert s._window_clause == ()
+
+
+def test_select_without_windows():
+    s = select(literal("foo").label("bar"))
+    assert (
+        str(s.compile(dialect=postgresql.dialect(), compile_kwargs=dict(literal_binds=True)))
+        == "SELECT 'foo' AS bar"
+    )
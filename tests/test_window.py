@@ -1,118 +1,113 @@
 import typing
 from itertools import combinations
-from unittest.mock import Mock
-from unittest.mock import patch
 
 import pytest
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import ArgumentError
 from sqlalchemy.sql import literal_column
+from sqlalchemy.sql.expression import ColumnClause
 
 from sqlalchemy_window import CURRENT_ROW
 from sqlalchemy_window import Window
 from sqlalchemy_window import window
 
+_PG_DIALECT = postgresql.dialect()
+
+_FOO: ColumnClause[typing.Any] = literal_column("foo")
+_BAR: ColumnClause[typing.Any] = literal_column("bar")
+
+_MUTEX_PAIRS = list(combinations(("range_", "rows", "groups"), 2))
+
 
 def compile_window(w: Window) -> str:
     """Compile window expression to string"""
-    return str(w.compile(dialect=postgresql.dialect()))
+    return str(w.compile(dialect=_PG_DIALECT))
 
 
-def test_override_partition_by_of_existing_window_without_partition_by_clause():
-    existing = Window("existing")
-    with pytest.raises(ArgumentError) as ctx:
-        Window("w", existing_window=existing, partition_by=literal_column("bar"))
+@pytest.fixture(scope="module")
+def empty_window() -> Window:
+    return Window("w")
 
-    assert "override PARTITION BY" in str(ctx.value)
 
+@pytest.fixture(scope="module")
+def existing_empty() -> Window:
+    return Window("existing")
 
-def test_override_partition_by_of_existing_window():
-    existing = Window("existing", partition_by=literal_column("foo"))
-    with pytest.raises(ArgumentError) as ctx:
-        Window("w", existing_window=existing, partition_by=literal_column("bar"))
 
-    assert "override PARTITION BY" in str(ctx.value)
+@pytest.fixture(scope="module")
+def existing_with_pb() -> Window:
+    return Window("existing", partition_by=_FOO)
 
 
-def test_order_by_with_existing_window_without_order_by_clause():
-    existing = Window("existing")
-    w = Window("w", existing_window=existing, order_by=literal_column("bar"))
-    assert compile_window(w) == "w AS (existing ORDER BY bar)"
+@pytest.fixture(scope="module")
+def existing_with_ob() -> Window:
+    return Window("existing", order_by=_FOO)
 
 
-def test_override_order_by_of_existing_window():
-    existing = Window("existing", order_by=literal_column("foo"))
-    with pytest.raises(ArgumentError) as ctx:
-        Window("w", existing_window=existing, order_by=literal_column("bar"))
+def test_override_partition_by_of_existing_window_without_partition_by_clause(
+    existing_empty: Window,
+):
+    with pytest.raises(ArgumentError, match="override PARTITION BY"):
+        Window("w", existing_window=existing_empty, partition_by=_BAR)
 
-    assert "override ORDER BY" in str(ctx.value)
 
+def test_override_partition_by_of_existing_window(existing_with_pb: Window):
+    with pytest.raises(ArgumentError, match="override PARTITION BY"):
+        Window("w", existing_window=existing_with_pb, partition_by=_BAR)
 
-def test_mutually_exclusive_parameters():
-    params = ("range_", "rows", "groups")
-    for args in combinations(params, 2):
-        with pytest.raises(ArgumentError) as ctx:
-            Window("w", **{a: (None, None) for a in args})
 
-        assert "mutually exclusive" in str(ctx.value)
+def test_order_by_with_existing_window_without_order_by_clause(existing_empty: Window):
+    w = Window("w", existing_window=existing_empty, order_by=_BAR)
+    assert compile_window(w) == "w AS (existing ORDER BY bar)"
 
 
-def test_pass_range():
-    value = Mock()
-    with patch.object(Window, "_normalize_range", return_value=value):
-        w = Window("w", range_=(None, None))
-        assert w.range_ is value
-        assert w.rows is None
-        assert w.groups is None
+def test_override_order_by_of_existing_window(existing_with_ob: Window):
+    with pytest.raises(ArgumentError, match="override ORDER BY"):
+        Window("w", existing_window=existing_with_ob, order_by=_BAR)
 
 
-def test_pass_rows():
-    value = Mock()
-    with patch.object(Window, "_normalize_range", return_value=value):
-        w = Window("w", rows=(None, None))
-        assert w.range_ is None
-        assert w.rows is value
-        assert w.groups is None
+@pytest.mark.parametrize("args", _MUTEX_PAIRS)
+def test_mutually_exclusive_parameters(args: typing.Tuple[str, str]):
+    with pytest.raises(ArgumentError, match="mutually exclusive"):
+        Window("w", **{a: (None, None) for a in args})  # type: ignore[arg-type]
 
 
-def test_pass_groups():
-    value = Mock()
-    with patch.object(Window, "_normalize_range", return_value=value):
-        w = Window("w", groups=(None, None))
-        assert w.range_ is None
-        assert w.rows is None
-        assert w.groups is value
+@pytest.mark.parametrize("attr", ["range_", "rows", "groups"])
+def test_pass_frame_kwarg(attr: str, monkeypatch: pytest.MonkeyPatch):
+    value = object()
+    monkeypatch.setattr(Window, "_normalize_range", staticmethod(lambda range_: value))
+    w = Window("w", **{attr: (None, None)})  # type: ignore[arg-type]
+    assert getattr(w, attr) is value
+    for other in {"range_", "rows", "groups"} - {attr}:
+        assert getattr(w, other) is None
 
 
 def test_invalid_exclude():
-    with pytest.raises(ArgumentError) as ctx:
+    with pytest.raises(ArgumentError, match="'exclude'"):
         Window("w", exclude="foobar")  # type: ignore
 
-    assert "'exclude'" in str(ctx.value)
-
 
 def test_missing_exclude():
     w = Window("w", exclude=None)
     assert w.exclude is None
 
 
-def test_compile_with_no_parameters():
-    w = Window("w")
-    assert compile_window(w) == "w AS ()"
+def test_compile_with_no_parameters(empty_window: Window):
+    assert compile_window(empty_window) == "w AS ()"
 
 
 def test_compile_with_partition_by():
-    w = Window("w", partition_by=literal_column("foo"))
+    w = Window("w", partition_by=_FOO)
     assert compile_window(w) == "w AS (PARTITION BY foo)"
 
 
 def test_compile_with_order_by():
-    w = Window("w", order_by=literal_column("foo"))
+    w = Window("w", order_by=_FOO)
     assert compile_window(w) == "w AS (ORDER BY foo)"
 
 
 def test_compile_with_partition_by_and_order_by():
-    w = Window("w", partition_by=literal_column("foo"), order_by=literal_column("bar"))
+    w = Window("w", partition_by=_FOO, order_by=_BAR)
     assert compile_window(w) == "w AS (PARTITION BY foo ORDER BY bar)"
 
 
@@ -124,10 +119,11 @@ def test_compile_with_partition_by_and_order_by():
         ((-2, None), "RANGE BETWEEN 2 PRECEDING AND UNBOUNDED FOLLOWING"),
         ((1, 3), "RANGE BETWEEN 1 FOLLOWING AND 3 FOLLOWING"),
     ],
+    ids=["neg_to_pos", "unbounded_pre", "neg_to_unbounded", "both_following"],
 )
 def test_compile_range(range_: typing.Tuple[int, int], result: str):
     w = Window("w", range_=range_)
-    assert result in compile_window(w)
+    assert compile_window(w) == f"w AS ({result})"
 
 
 @pytest.mark.parametrize(
@@ -138,10 +134,11 @@ def test_compile_range(range_: typing.Tuple[int, int], result: str):
         ((-2, None), "ROWS BETWEEN 2 PRECEDING AND UNBOUNDED FOLLOWING"),
         ((1, 3), "ROWS BETWEEN 1 FOLLOWING AND 3 FOLLOWING"),
     ],
+    ids=["neg_to_pos", "current_to_pos", "neg_to_unbounded", "both_following"],
 )
 def test_compile_rows(rows: typing.Tuple[int, int], result: str):
     w = Window("w", rows=rows)
-    assert result in compile_window(w)
+    assert compile_window(w) == f"w AS ({result})"
 
 
 @pytest.mark.parametrize(
@@ -152,31 +149,34 @@ def test_compile_rows(rows: typing.Tuple[int, int], result: str):
         ((-2, None), "GROUPS BETWEEN 2 PRECEDING AND UNBOUNDED FOLLOWING"),
         ((1, 3), "GROUPS BETWEEN 1 FOLLOWING AND 3 FOLLOWING"),
     ],
+    ids=["neg_to_pos", "unbounded_pre", "neg_to_unbounded", "both_following"],
 )
 def test_compile_groups(groups: typing.Tuple[int, int], result: str):
     w = Window("w", groups=groups)
-    assert result in compile_window(w)
+    assert compile_window(w) == f"w AS ({result})"
 
 
 def test_compile_range_with_exclude():
     w = Window("w", range_=(None, None), exclude=CURRENT_ROW)
-    assert "EXCLUDE CURRENT ROW" in compile_window(w)
+    assert compile_window(w) == (
+        "w AS (RANGE BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING EXCLUDE CURRENT ROW)"
+    )
 
 
-@pytest.mark.parametrize(("range_"), [("foobar",), ((1, 2, 3),)])
-def test_compile_incorrect_range(range_: typing.Any):
-    with pytest.raises(ArgumentError) as ctx:
+@pytest.mark.parametrize(
+    ("range_", "message"),
+    [
+        (("foobar",), "2-tuple expected"),
+        (((1, 2, 3),), "2-tuple expected"),
+        ("foobar", "2-tuple expected"),
+        ((1, 2, 3), "2-tuple expected"),
+        ((1, "foo"), "int or None expected"),
+    ],
+)
+def test_compile_incorrect_range(range_: typing.Any, message: str):
+    with pytest.raises(ArgumentError, match=message):
         Window("w", range_=range_)
 
-    assert "2-tuple expected" in str(ctx.value)
-
-
-def test_compile_incorrect_range_value():
-    with pytest.raises(ArgumentError) as ctx:
-        Window("w", range_=(1, "foo"))  # type: ignore
-
-    assert "int or None expected" in str(ctx.value)
-
 
 def test_window_factory():
     w = window("w")